@@ -2,19 +2,171 @@ import csv
 import datetime as dt
 import os
 import tkinter as tk
-from collections import OrderedDict
-from functools import partial
+from dataclasses import dataclass, field
+from functools import cached_property
 from tkinter import messagebox, PhotoImage, ttk
 from tkinter.font import Font, nametofont
 
 from tkcalendar import Calendar
 
-from .TimeLogic import DateCalc, TimeConvert, TimeCalc
+from .TimeLogic import DateCalc, TimeConvert, TimeCalc, parse_date
 from .ValidateWidget import DateInput, IntEntry, ValidatedCombobox, TimeEntry, RequiredEntry
 
-import sys
 
-sys.path.insert(1, os.path.join(sys.path[0], '..'))
+###########################
+# SHARED FONTS AND IMAGES #
+###########################
+
+# every font & image is created once per application, later windows reuse the same objects
+# (the dict also keeps a reference to images so python garbage collector won't catch them)
+_RESOURCES = {}
+
+
+def _get_resources(root: tk.Misc) -> dict:
+    """Returns fonts and images shared by application windows, creating them on first call"""
+
+    if _RESOURCES:
+        return _RESOURCES
+
+    default_font = nametofont('TkTextFont', root=root)
+    default_font.config(
+        family="ds-digital",
+        weight='normal',
+        size=15
+    )
+
+    _RESOURCES['button_font'] = Font(
+        root,
+        family='Slabo 27px',
+        size=11,
+        weight='bold',
+        slant='roman',
+        underline=False,
+        overstrike=False
+    )
+    _RESOURCES['text_field'] = Font(
+        root,
+        family="Fira Code",
+        size=15,
+        weight='normal',
+        slant='roman'
+    )
+    _RESOURCES['label_font'] = Font(
+        root,
+        family='Catamaran SemiBold',
+        size=11,
+        weight='normal',
+        slant='roman',
+    )
+    _RESOURCES['frame_l_font'] = Font(
+        root,
+        family="Arvo",
+        size=15,
+        weight='normal',
+        slant='italic',
+    )
+    _RESOURCES['process_font'] = Font(
+        root,
+        family='Cascadia Code Bold',
+        size=13,
+        slant='roman'
+    )
+    _RESOURCES['logo'] = PhotoImage(
+        master=root,
+        file=r"assets/SmallCalendar.png"
+    )
+
+    return _RESOURCES
+
+
+# ttk styles live in the Tcl interpreter, so configuring them for the first window is enough
+_STYLES_INSTALLED = False
+
+
+def _install_styles(style: ttk.Style, labelframe_color: tuple) -> None:
+    """Configures all ttk styles used by calendar application window, only once per application"""
+
+    global _STYLES_INSTALLED
+    if _STYLES_INSTALLED:
+        return
+
+    resources = _get_resources(style.master)
+
+    style.configure(
+        'label_style_0.TLabel',
+        **labelframe_color[0]
+    )
+    style.configure(
+        "label_style_1.TLabel",
+        **labelframe_color[1]
+    )
+    style.configure(
+        'text_field.TEntry',
+        font=resources['text_field'],
+    )
+    style.configure(
+        'text_field.TCombobox',
+        font=resources['text_field'],
+    )
+    style.configure(
+        "process.TButton",
+        font=resources['process_font'],
+        foreground="#4169e1",
+    )
+
+    # styling for events tree
+    style.configure("tree_style.Treeview", highlightthickness=0, bd=0, font=(
+        'Arvo', 10))  # Modify the font of the body
+    style.configure("tree_style.Treeview.Heading", font=(
+        'Catamaran SemiBold', 12, 'bold'))  # Modify the font of the headings
+    style.layout("tree_style.Treeview", [
+        ('tree_style.Treeview.treearea', {'sticky': 'news'})])  # Remove the borders
+
+    _STYLES_INSTALLED = True
+
+
+# Tcl lambda appending many rows to a treeview, rows are given as flat list of iid, text and values.
+# Tkinter turns python tuples into proper Tcl lists, so event names need no quoting here.
+_TCL_INSERT_ROWS = (
+    '{tree rows} {'
+    'foreach {iid text values} $rows {$tree insert {} end -id $iid -text $text -values $values}'
+    '}'
+)
+
+
+#############
+# CSV FILES #
+#############
+
+# users and events csv files are read whole, a large buffer lets that happen in few read calls
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _open_csv(file_name: str, mode: str = 'r'):
+    """Opens a csv file of application the way csv module expects it, with a large buffer"""
+
+    return open(file_name, mode, newline='', buffering=_CSV_BUFFER_SIZE)
+
+
+#####################################
+# CONTAINER FOR SUB-FEATURE WIDGETS #
+#####################################
+
+
+@dataclass(slots=True)
+class SubFeature:
+    """
+    A sub-feature shown on screen when its feature is clicked.
+
+    Attributes
+    frame: container widget in which all the fields of sub-feature are placed
+    widgets: fields of sub-feature by name, fields placed side by side are stored as tuple
+    laid_out: whether fields have been gridded inside frame, which is done when it is first shown
+    """
+
+    frame: tk.Widget
+    widgets: dict = field(default_factory=dict)
+    laid_out: bool = False
 
 
 ######################################
@@ -34,11 +186,13 @@ class LabelInput(ttk.Frame):
                 don't use variables
     input_args: this is an optional dictionary of any additional arguments for the input constructor
     label_args: This is an optional of any additional arguments for the label constructor
+    readonly: If True, a ttk.Label showing the value is used instead of input widget and variable,
+                for fields which only display output
     **kwargs: these will be passed to the Frame constructor
     """
 
     def __init__(self, parent, label: str = '', input_class=ttk.Entry, input_var=None, input_args=None, label_args=None,
-                 **kwargs):
+                 readonly: bool = False, **kwargs):
         super().__init__(parent, **kwargs)
 
         # The accepted practice is to pass None for mutable types like dict and list, then replacing
@@ -46,6 +200,7 @@ class LabelInput(ttk.Frame):
         input_args = input_args or {}
         label_args = label_args or {}
         self.variable = input_var
+        self.readonly = readonly
 
         if input_class in (ttk.Checkbutton, ttk.Button, ttk.Radiobutton):
             input_args["text"] = label
@@ -57,17 +212,27 @@ class LabelInput(ttk.Frame):
         else:
             self.label = ttk.Label(self, text=label, **label_args)
             self.label.grid(row=0, column=0, sticky=(tk.W + tk.E))
-            input_args["textvariable"] = input_var
 
-            self.input = input_class(self, **input_args)
+            if readonly:
+                # output only field, its text is set directly so no tkinter variable is needed
+                self._text = ''
+                self.input = ttk.Label(self, **input_args)
+            else:
+                input_args["textvariable"] = input_var
+                self.input = input_class(self, **input_args)
             self.input.grid(row=0, column=1, sticky=(tk.W + tk.E))
 
         self.columnconfigure(0, weight=1)
-        self.error = getattr(self.input, 'error', tk.StringVar())
-        self.error_label = ttk.Label(
-            self, textvariable=self.error, justify='right', **label_args, )
-        self.error_label.grid(
-            row=1, column=0, sticky='ew', columnspan=2)
+        # only validated inputs have an error variable, others could never show anything in error label
+        self.error = getattr(getattr(self, 'input', None), 'error', None)
+        self.error_label = None
+        if self.error is not None:
+            self.error_label = ttk.Label(
+                self, textvariable=self.error, justify='right', **label_args, )
+            self.error_label.grid(
+                row=1, column=0, sticky='ew', columnspan=2)
+
+        self._get_impl, self._set_impl = self._pick_accessors()
 
     def grid(self, sticky=(tk.E + tk.W), **kwargs) -> None:
         '''Overrides the default grid method to set sticky
@@ -82,20 +247,21 @@ class LabelInput(ttk.Frame):
         # under certain conditions, such as when a numeric field is empty
         # (blank strings can't be converted to number) in that case return empty string: ''
         try:
-            if self.variable:
-                return self.variable.get()
-            elif isinstance(self.input, tk.Text):
-                # tk.Text requires a range to retrieve text. It gives entire data inn the field
-                return self.input.get('1.0', tk.END)
-            else:
-                return self.input.get()
-
+            return self._get_impl()
         except (TypeError, tk.TclError):
             # happens when numeric fields are empty.
             return ''
 
     def set(self, value, *args, **kwargs) -> None:
+        '''Custom set method that changes the current value of widget, see _pick_accessors'''
+
+        self._set_impl(value, *args, **kwargs)
+
+    def _pick_accessors(self) -> tuple:
         '''
+        Returns (getter, setter) suitable for this widget, types of widget and
+        variable never change after construction so it is decided just once
+        -> If it's a readonly field, the text of its label is used.
         -> If we have a variable of class BooleanVar, cast value to bool
         and set it. BooleanVar.set() will only take a bool, not other
         falsy or truthy values. This ensures our variable only gets an
@@ -109,21 +275,67 @@ class LabelInput(ttk.Frame):
         methods.
         '''
 
+        input_widget = getattr(self, 'input', None)
+
+        if self.readonly:
+            return self._get_readonly, self._set_readonly
+
+        if self.variable:
+            getter = self._get_var
+        elif isinstance(input_widget, tk.Text):
+            getter = self._get_text
+        else:
+            getter = self._get_entry
+
         if isinstance(self.variable, tk.BooleanVar):
-            self.variable.set(bool(value))
-        elif type(self.input) in (ttk.Checkbutton, ttk.Radiobutton):
-            if value:
-                self.input.select()
-            else:
-                self.input.deselect()
-        elif isinstance(self.input, tk.Text):
-            self.input.delete('1.0', tk.END)
-            self.input.insert('1.0', value)
+            setter = self._set_bool
+        elif type(input_widget) in (ttk.Checkbutton, ttk.Radiobutton):
+            setter = self._set_button
+        elif isinstance(input_widget, tk.Text):
+            setter = self._set_text
         elif self.variable:
-            self.variable.set(value, *args, **kwargs)
+            setter = self._set_var
         else:  # input must be an Entry-type widget with no variable
-            self.input.delete(0, tk.END)
-            self.input.insert(0, value)
+            setter = self._set_entry
+
+        return getter, setter
+
+    def _get_readonly(self) -> str:
+        return self._text
+
+    def _get_var(self):
+        return self.variable.get()
+
+    def _get_text(self) -> str:
+        # tk.Text requires a range to retrieve text. It gives entire data inn the field
+        return self.input.get('1.0', tk.END)
+
+    def _get_entry(self) -> str:
+        return self.input.get()
+
+    def _set_readonly(self, value, *args, **kwargs) -> None:
+        self._text = str(value)
+        self.input.configure(text=self._text)
+
+    def _set_bool(self, value, *args, **kwargs) -> None:
+        self.variable.set(bool(value))
+
+    def _set_button(self, value, *args, **kwargs) -> None:
+        if value:
+            self.input.select()
+        else:
+            self.input.deselect()
+
+    def _set_text(self, value, *args, **kwargs) -> None:
+        self.input.delete('1.0', tk.END)
+        self.input.insert('1.0', value)
+
+    def _set_var(self, value, *args, **kwargs) -> None:
+        self.variable.set(value, *args, **kwargs)
+
+    def _set_entry(self, value, *args, **kwargs) -> None:
+        self.input.delete(0, tk.END)
+        self.input.insert(0, value)
 
 
 ################################
@@ -143,6 +355,29 @@ class Window(tk.Frame):
             6. Show all the events of a particular user
     '''
 
+    # columns of events tree with every option spelled out, same for all windows
+    column_defs = {
+        '#0': {'label': 'Row', 'anchor': tk.W, 'minwidth': 10, 'width': 40, 'stretch': False},
+        'name': {'label': 'Name', 'anchor': tk.CENTER, 'minwidth': 10, 'width': 150, 'stretch': True},
+        'type': {'label': 'Type', 'anchor': tk.CENTER, 'minwidth': 10, 'width': 90, 'stretch': True},
+        'date': {'label': 'Date', 'anchor': tk.CENTER, 'minwidth': 10, 'width': 90, 'stretch': False},
+        'recurring': {'label': 'Recurring', 'anchor': tk.CENTER, 'minwidth': 10, 'width': 70, 'stretch': False},
+        'start_timing': {'label': "Start Time", 'anchor': tk.CENTER, 'minwidth': 10, 'width': 90, 'stretch': False},
+        'end_timing': {'label': "End Time", 'anchor': tk.CENTER, 'minwidth': 10, 'width': 90, 'stretch': False},
+    }
+    # names of columns holding event values, every column except the row number one
+    value_columns = tuple(column_defs)[1:]
+
+    # grid options of sub-feature fields by their type
+    grid_options = {
+        LabelInput: {'sticky': 'ew', 'pady': (10, 0)},
+        Calendar: {'pady': (10, 0), 'ipadx': 100, 'ipady': 60},
+    }
+    # grid options of fields of any other type, like submit buttons
+    default_grid_options = {'sticky': 'ew', 'pady': (10, 0), 'ipady': 5, 'ipadx': 5, 'columnspan': 2}
+    # grid options shared by fields placed side by side
+    side_by_side_grid_options = {'sticky': 'news', 'pady': (10, 0)}
+
     def __init__(self, parent, user_name: str, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
@@ -153,84 +388,28 @@ class Window(tk.Frame):
             {"background": "#03a45e"}
         )
 
-        self.style = ttk.Style()
-        self.style.configure(
-            'label_style_0.TLabel',
-            **self.labelframe_color[0]
-        )
-        self.style.configure(
-            "label_style_1.TLabel",
-            **self.labelframe_color[1]
-        )
+        resources = _get_resources(self)
+        button_font = resources['button_font']
+        self.label_font = resources['label_font']
+        self.frame_l_font = resources['frame_l_font']
 
-        button_font = Font(
-            family='Slabo 27px',
-            size=11,
-            weight='bold',
-            slant='roman',
-            underline=False,
-            overstrike=False
+        # label arguments shared by every LabelInput of window, one for each sub-feature colour
+        self.label_args = (
+            {'font': self.label_font, 'style': 'label_style_0.TLabel'},
+            {'font': self.label_font, 'style': 'label_style_1.TLabel'},
         )
 
-        default_font = nametofont('TkTextFont')
-        default_font.config(
-            family="ds-digital",
-            weight='normal',
-            size=15
-        )
-        text_field = Font(
-            family="Fira Code",
-            size=15,
-            weight='normal',
-            slant='roman'
-        )
-        self.style.configure(
-            'text_field.TEntry',
-            font=text_field,
-        )
-        self.style.configure(
-            'text_field.TCombobox',
-            font=text_field,
-        )
-
-        label_font = Font(
-            family='Catamaran SemiBold',
-            size=11,
-            weight='normal',
-            slant='roman',
-        )
-        frame_l_font = Font(
-            family="Arvo",
-            size=15,
-            weight='normal',
-            slant='italic',
-        )
-        process_font = Font(
-            family='Cascadia Code Bold',
-            size=13,
-            slant='roman'
-        )
-        self.style.configure(
-            "process.TButton",
-            font=process_font,
-            foreground="#4169e1",
-        )
-
-        # creating file_name in user's documents directory
-        self.file_name = os.path.join(
-            os.path.expanduser('~'), "Documents",
-            f"{self.user}-calendar.csv"
-        )
+        self.style = ttk.Style(self)
+        _install_styles(self.style, self.labelframe_color)
 
         # every widget resides in this frame
         mainframe = ttk.Frame(self)
 
         # dictionary of all the widgets in the mainframe
-        self.widgets = OrderedDict()
+        self.widgets = {}
 
         # setting up logo pic in (0,0) position of feature table
-        logo_pic = PhotoImage(
-            file=r"assets/SmallCalendar.png")
+        logo_pic = resources['logo']
         self.widgets['logo'] = tk.Label(
             mainframe,
             image=logo_pic,
@@ -252,7 +431,7 @@ class Window(tk.Frame):
             year=today_date.year,
             month=today_date.month,
             day=today_date.day,
-            font=label_font,
+            font=self.label_font,
             selectforeground='#191970',
             normalforeground="#FDFEFF",
             normalbackground="#343434",
@@ -278,381 +457,441 @@ class Window(tk.Frame):
         )
         self.widgets['date_calculator'].grid(
             row=1, column=0, sticky='news')
+        self.date_calculator_widgets = None  # created by _build_date_calculator on first click
+
+        # Feature #2: Time Calculator
+        self.widgets['time_calculator'] = tk.Button(
+            mainframe,
+            text="Time Calculator",
+            command=self.place_time_calculator,
+            bg="#0066b4", fg="#ffd500",
+            font=button_font
+
+        )
+        self.widgets['time_calculator'].grid(row=2, column=0, sticky='news')
+        self.time_calculator_widgets = None  # created by _build_time_calculator on first click
+
+        # Feature #3: Unit Converter
+        self.widgets['unit_conversion'] = tk.Button(
+            mainframe,
+            text="Unit Conversion",
+            command=self.place_unit_convert,
+            bg="#0066b4", fg="#ffd500",
+            font=button_font
+
+        )
+        self.widgets['unit_conversion'].grid(row=3, column=0, sticky='news')
+        self.unit_conversion_widgets = None  # created by _build_unit_conversion on first click
 
-        # setting up OrderedDictionary for aforementioned feature where all the sub-features will reside
-        # syntax = {sub_feature: (sub_feature_container, sub_feature_widgets:dict)}
-        self.date_calculator_widgets = OrderedDict()
+        # Feature #4: New Event creator
+        self.widgets['new_events'] = tk.Button(
+            mainframe,
+            text="New Event",
+            command=self.place_new_event,
+            bg="#0066b4", fg="#ffd500",
+            font=button_font
+
+        )
+        self.widgets['new_events'].grid(row=4, column=0, sticky='news')
+        self.new_events_widgets = None  # created by _build_new_events on first click
+
+        # Feature #5: Show Calendar
+        self.widgets['show_calendar'] = tk.Button(
+            mainframe,
+            text="Show Calendar of Year/Month",
+            command=self.place_show_calendar,
+            bg="#0066b4", fg="#ffd500",
+            font=button_font
+
+        )
+        self.widgets['show_calendar'].grid(row=5, column=0, sticky='news')
+        self.show_calendar_widgets = None  # created by _build_show_calendar on first click
+
+        # Feature #6: Show current events in program
+        self.widgets['show_current_events'] = tk.Button(
+            mainframe,
+            text='Show Events',
+            command=self.place_show_event,
+            bg="#0066b4", fg="#ffd500",
+            font=button_font
+
+        )
+        self.widgets['show_current_events'].grid(
+            row=6, column=0, sticky='news')
+        self.show_current_events_widgets = None  # created by _build_show_current_events on first click
+
+        # placing the mainframe and feature_frame
+        mainframe.grid(row=0, sticky=(tk.S + tk.N))
+        self.widgets['feature_frame'].grid(
+            row=0, column=1, rowspan=7, columnspan=3, padx=30)
+
+        # frames currently shown in feature_frame, hidden by _hide_active_feature when another feature is clicked
+        self._active_frames: list = [self.add_calendar]
+
+        # disable some features of guest account
+        if self.user == 'guest':
+            self.widgets['show_current_events'].config(state='disabled')
+            self.widgets['new_events'].config(state='disabled')
+
+        # function handling submit of each feature by feature id, all are called with sub-feature id,
+        # output field and data of sub-feature
+        self._submit_dispatch = {
+            1: lambda sub_feat_id, output, data: self.date_calc(sub_feat_id, output, **data),
+            2: lambda sub_feat_id, output, data: self.time_calc(sub_feat_id, output, **data),
+            3: lambda sub_feat_id, output, data: self.unit_converter(data, output),
+            4: self._submit_event,
+        }
+
+        # user's csv file and its writer, opened on first new event and kept open till window is destroyed
+        self._events_file = None
+        self._events_writer = None
+        self.bind('<Destroy>', self._close_events_file, add='+')
+
+        # parsed rows of user's csv file, kept along with file's stat to know when to read it again
+        self._events_cache = None
+        # rows whose events are currently marked in show calendar
+        self._marked_events = None
+
+    @cached_property
+    def file_name(self) -> str:
+        '''user's csv file in user's documents directory, only resolved when it is first needed'''
+
+        return os.path.join(
+            os.path.expanduser('~'), "Documents",
+            f"{self.user}-calendar.csv"
+        )
+
+    def _build_date_calculator(self):
+        '''creates date calculator widgets, only done the first time they are put on screen'''
+
+        # setting up dictionary for date calculator feature where all the sub-features will reside
+        # syntax = {sub_feature: SubFeature(sub_feature_container, sub_feature_widgets:dict)}
+        self.date_calculator_widgets = {}
         # declaring the widgets inside the date calculator feature
 
         # Sub-Feature #1.1
-        self.date_calculator_widgets['time_bw_date_label'] = (
+        self.date_calculator_widgets['time_bw_date_label'] = SubFeature(
             tk.LabelFrame(self.widgets['feature_frame'],
                           text="Day(s) B/W two dates",
                           foreground='red',
-                          font=frame_l_font),
-            OrderedDict()
+                          font=self.frame_l_font,
+                          **self.labelframe_color[0])
         )
-        self.date_calculator_widgets['time_bw_date_label'][1]["start_date"] = LabelInput(
-            self.date_calculator_widgets['time_bw_date_label'][0],
+        self.date_calculator_widgets['time_bw_date_label'].widgets["start_date"] = LabelInput(
+            self.date_calculator_widgets['time_bw_date_label'].frame,
             "Start Date",
             input_class=DateInput,
             input_var=tk.StringVar(),
-            input_args={"locale": 'en_US', "date_pattern": 'yyyy-MM-dd'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.date_calculator_widgets['time_bw_date_label'][1]["end_date"] = LabelInput(
-            self.date_calculator_widgets['time_bw_date_label'][0],
+        self.date_calculator_widgets['time_bw_date_label'].widgets["end_date"] = LabelInput(
+            self.date_calculator_widgets['time_bw_date_label'].frame,
             "End Date",
             input_class=DateInput,
             input_var=tk.StringVar(),
-            input_args={"locale": 'en_US', "date_pattern": 'yyyy-MM-dd'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.date_calculator_widgets['time_bw_date_label'][1]['output'] = LabelInput(
-            self.date_calculator_widgets['time_bw_date_label'][0],
+        self.date_calculator_widgets['time_bw_date_label'].widgets['output'] = LabelInput(
+            self.date_calculator_widgets['time_bw_date_label'].frame,
             "Day(s) between the dates",
-            input_var=tk.StringVar(),
-            input_args={'state': 'disabled'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            readonly=True,
+            label_args=self.label_args[0]
         ),
-        self.date_calculator_widgets['time_bw_date_label'][1]["submit"] = ttk.Button(
-            self.date_calculator_widgets['time_bw_date_label'][0],
+        self.date_calculator_widgets['time_bw_date_label'].widgets["submit"] = ttk.Button(
+            self.date_calculator_widgets['time_bw_date_label'].frame,
             text="Process",
-            command=partial(self.submit, 1.1),
+            command=self._submit_day_difference,
             style='process.TButton'
         )
 
         # Sub-Feature #1.2
-        self.date_calculator_widgets['date_after_period'] = (
+        self.date_calculator_widgets['date_after_period'] = SubFeature(
             tk.LabelFrame(
                 self.widgets['feature_frame'],
                 text="date after a particular time period".title(),
-                font=frame_l_font,
-                foreground="#172e7c"
-            ),
-            OrderedDict()
+                font=self.frame_l_font,
+                foreground="#172e7c",
+                **self.labelframe_color[1]
+            )
         )
-        self.date_calculator_widgets['date_after_period'][1]['date'] = LabelInput(
-            self.date_calculator_widgets['date_after_period'][0],
+        self.date_calculator_widgets['date_after_period'].widgets['date'] = LabelInput(
+            self.date_calculator_widgets['date_after_period'].frame,
             "Start Date",
             input_class=DateInput,
             input_var=tk.StringVar(),
-            input_args={"locale": 'en_US', "date_pattern": 'yyyy-MM-dd'},
-            label_args={'font': label_font, "style": 'label_style_1.TLabel'}
+            label_args=self.label_args[1]
         )
-        self.date_calculator_widgets['date_after_period'][1]['increment'] = (
+        self.date_calculator_widgets['date_after_period'].widgets['increment'] = (
             LabelInput(
-                self.date_calculator_widgets['date_after_period'][0],
+                self.date_calculator_widgets['date_after_period'].frame,
                 "Period",
                 input_class=IntEntry,
                 input_var=tk.StringVar(),
-                label_args={'font': label_font,
-                            "style": 'label_style_1.TLabel'}
+                label_args=self.label_args[1]
             ),
             LabelInput(
-                self.date_calculator_widgets['date_after_period'][0],
+                self.date_calculator_widgets['date_after_period'].frame,
                 "Unit",
                 input_class=ValidatedCombobox,
                 input_var=tk.StringVar(),
                 input_args={"values": [
                     "day(s)", "week(s)", "month(s)", "year(s)"]},
-                label_args={'font': label_font,
-                            "style": 'label_style_1.TLabel'}
+                label_args=self.label_args[1]
             )
         )
-        self.date_calculator_widgets['date_after_period'][1]['output'] = LabelInput(
-            self.date_calculator_widgets['date_after_period'][0],
+        self.date_calculator_widgets['date_after_period'].widgets['output'] = LabelInput(
+            self.date_calculator_widgets['date_after_period'].frame,
             "Date after period",
-            input_var=tk.StringVar(),
-            input_args={'state': 'disabled'},
-            label_args={'font': label_font, "style": 'label_style_1.TLabel'}
+            readonly=True,
+            label_args=self.label_args[1]
         )
-        self.date_calculator_widgets['date_after_period'][1]['submit'] = ttk.Button(
-            self.date_calculator_widgets['date_after_period'][0],
+        self.date_calculator_widgets['date_after_period'].widgets['submit'] = ttk.Button(
+            self.date_calculator_widgets['date_after_period'].frame,
             text="Process",
             style='process.TButton',
-            command=partial(self.submit, 1.2)
+            command=self._submit_date_after_period
         )
 
-        # Feature #2: Time Calculator
-        self.widgets['time_calculator'] = tk.Button(
-            mainframe,
-            text="Time Calculator",
-            command=self.place_time_calculator,
-            bg="#0066b4", fg="#ffd500",
-            font=button_font
+    def _build_time_calculator(self):
+        '''creates time calculator widgets, only done the first time they are put on screen'''
 
-        )
-        self.widgets['time_calculator'].grid(row=2, column=0, sticky='news')
-        self.time_calculator_widgets = OrderedDict()
+        self.time_calculator_widgets = {}
 
         # Sub-Feature #2.1
-        self.time_calculator_widgets['time_difference'] = (
+        self.time_calculator_widgets['time_difference'] = SubFeature(
             tk.LabelFrame(
                 self.widgets['feature_frame'],
                 text="Time Difference between two time stamps".title(),
                 foreground='red',
-                font=frame_l_font),
-            OrderedDict()
+                font=self.frame_l_font,
+                **self.labelframe_color[0])
         )
-        self.time_calculator_widgets['time_difference'][1]['start_time'] = LabelInput(
-            self.time_calculator_widgets['time_difference'][0],
+        self.time_calculator_widgets['time_difference'].widgets['start_time'] = LabelInput(
+            self.time_calculator_widgets['time_difference'].frame,
             "Start Time",
             input_class=TimeEntry,
             input_var=tk.StringVar(),
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.time_calculator_widgets['time_difference'][1]['end_time'] = LabelInput(
-            self.time_calculator_widgets['time_difference'][0],
+        self.time_calculator_widgets['time_difference'].widgets['end_time'] = LabelInput(
+            self.time_calculator_widgets['time_difference'].frame,
             "End Time",
             input_class=TimeEntry,
             input_var=tk.StringVar(),
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.time_calculator_widgets['time_difference'][1]['output'] = LabelInput(
-            self.time_calculator_widgets['time_difference'][0],
+        self.time_calculator_widgets['time_difference'].widgets['output'] = LabelInput(
+            self.time_calculator_widgets['time_difference'].frame,
             "Time difference",
-            input_var=tk.StringVar(),
-            input_args={'state': 'disabled'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            readonly=True,
+            label_args=self.label_args[0]
         )
-        self.time_calculator_widgets['time_difference'][1]['submit'] = ttk.Button(
-            self.time_calculator_widgets['time_difference'][0],
+        self.time_calculator_widgets['time_difference'].widgets['submit'] = ttk.Button(
+            self.time_calculator_widgets['time_difference'].frame,
             text="Process",
             style='process.TButton',
-            command=partial(self.submit, 2.1)
+            command=self._submit_time_difference
         )
 
         # Sub-Feature #2.2
-        self.time_calculator_widgets['time_after_increment'] = (
+        self.time_calculator_widgets['time_after_increment'] = SubFeature(
             tk.LabelFrame(
                 self.widgets['feature_frame'],
                 text="Time after increment value".title(),
-                font=frame_l_font,
+                font=self.frame_l_font,
                 foreground="#172e7c",
-            ),
-            OrderedDict()
+                **self.labelframe_color[1]
+            )
         )
-        self.time_calculator_widgets['time_after_increment'][1]['time'] = LabelInput(
-            self.time_calculator_widgets['time_after_increment'][0],
+        self.time_calculator_widgets['time_after_increment'].widgets['time'] = LabelInput(
+            self.time_calculator_widgets['time_after_increment'].frame,
             "Time",
             input_class=TimeEntry,
             input_var=tk.StringVar(),
-            label_args={'font': label_font, "style": 'label_style_1.TLabel'}
+            label_args=self.label_args[1]
         )
-        self.time_calculator_widgets['time_after_increment'][1]['seconds_to_increment'] = (
+        self.time_calculator_widgets['time_after_increment'].widgets['seconds_to_increment'] = (
             LabelInput(
-                self.time_calculator_widgets['time_after_increment'][0],
+                self.time_calculator_widgets['time_after_increment'].frame,
                 "Increment Value",
                 input_class=IntEntry,
                 input_var=tk.StringVar(),
-                label_args={'font': label_font,
-                            "style": 'label_style_1.TLabel'}
+                label_args=self.label_args[1]
             ),
             LabelInput(
-                self.time_calculator_widgets['time_after_increment'][0],
+                self.time_calculator_widgets['time_after_increment'].frame,
                 "Unit",
                 input_class=ValidatedCombobox,
                 input_var=tk.StringVar(),
                 input_args={"values": ["sec", "min", "hrs"]},
-                label_args={'font': label_font,
-                            "style": 'label_style_1.TLabel'}
+                label_args=self.label_args[1]
             )
         )
-        self.time_calculator_widgets['time_after_increment'][1]['output'] = LabelInput(
-            self.time_calculator_widgets['time_after_increment'][0],
+        self.time_calculator_widgets['time_after_increment'].widgets['output'] = LabelInput(
+            self.time_calculator_widgets['time_after_increment'].frame,
             "Output Time",
-            input_var=tk.StringVar(),
-            input_args={'state': 'disabled'},
-            label_args={'font': label_font,
-                        "style": 'label_style_1.TLabel'}
+            readonly=True,
+            label_args=self.label_args[1]
         )
-        self.time_calculator_widgets['time_after_increment'][1]['submit'] = ttk.Button(
-            self.time_calculator_widgets['time_after_increment'][0],
+        self.time_calculator_widgets['time_after_increment'].widgets['submit'] = ttk.Button(
+            self.time_calculator_widgets['time_after_increment'].frame,
             text='Process',
             style='process.TButton',
-            command=partial(self.submit, 2.2)
+            command=self._submit_time_after_increment
         )
 
-        # Feature #3: Unit Converter
-        self.widgets['unit_conversion'] = tk.Button(
-            mainframe,
-            text="Unit Conversion",
-            command=self.place_unit_convert,
-            bg="#0066b4", fg="#ffd500",
-            font=button_font
+    def _build_unit_conversion(self):
+        '''creates unit convertor widgets, only done the first time they are put on screen'''
 
-        )
-        self.widgets['unit_conversion'].grid(row=3, column=0, sticky='news')
-        self.unit_conversion_widgets = OrderedDict()
+        self.unit_conversion_widgets = {}
 
         # Sub-Feature #3.1
-        self.unit_conversion_widgets['Conversion'] = (
+        self.unit_conversion_widgets['Conversion'] = SubFeature(
             tk.LabelFrame(
                 self.widgets['feature_frame'],
                 text="Convert time from one unit to another".title(),
-                font=frame_l_font,
+                font=self.frame_l_font,
                 foreground='red',
-            ),
-            OrderedDict()
+                **self.labelframe_color[0]
+            )
         )
-        self.unit_conversion_widgets['Conversion'][1]['input_time'] = (
+        self.unit_conversion_widgets['Conversion'].widgets['input_time'] = (
             LabelInput(
-                self.unit_conversion_widgets['Conversion'][0],
+                self.unit_conversion_widgets['Conversion'].frame,
                 "Number",
                 input_class=IntEntry,
                 input_var=tk.StringVar(),
-                label_args={'font': label_font,
-                            "style": 'label_style_0.TLabel'}
+                label_args=self.label_args[0]
             ),
             LabelInput(
-                self.unit_conversion_widgets['Conversion'][0],
+                self.unit_conversion_widgets['Conversion'].frame,
                 "Unit",
                 input_var=tk.StringVar(),
                 input_args={"values": ["sec", "min",
                                        "hour", "day(s)", "week(s)", "year(s)"]},
                 input_class=ValidatedCombobox,
-                label_args={'font': label_font,
-                            "style": 'label_style_0.TLabel'}
+                label_args=self.label_args[0]
             )
         )
-        self.unit_conversion_widgets['Conversion'][1]['output'] = (
+        self.unit_conversion_widgets['Conversion'].widgets['output'] = (
             LabelInput(
-                self.unit_conversion_widgets['Conversion'][0],
+                self.unit_conversion_widgets['Conversion'].frame,
                 "Output Numerical Value",
-                input_var=tk.StringVar(),
-                input_args={'state': 'disabled'},
-                label_args={'font': label_font,
-                            "style": 'label_style_0.TLabel'},
+                readonly=True,
+                label_args=self.label_args[0],
             ),
             LabelInput(
-                self.unit_conversion_widgets['Conversion'][0],
+                self.unit_conversion_widgets['Conversion'].frame,
                 "Unit",
                 input_var=tk.StringVar(),
                 input_args={"values": ["sec", "min",
                                        "hour", "day(s)", "week(s)", "year(s)"]},
                 input_class=ValidatedCombobox,
-                label_args={'font': label_font,
-                            "style": 'label_style_0.TLabel'}
+                label_args=self.label_args[0]
             )
         )
-        self.unit_conversion_widgets['Conversion'][1]['submit'] = ttk.Button(
-            self.unit_conversion_widgets['Conversion'][0],
+        self.unit_conversion_widgets['Conversion'].widgets['submit'] = ttk.Button(
+            self.unit_conversion_widgets['Conversion'].frame,
             text='Process',
             style='process.TButton',
-            command=partial(self.submit, 3.1)
+            command=self._submit_unit_conversion
         )
 
-        # Feature #4: New Event creator
-        self.widgets['new_events'] = tk.Button(
-            mainframe,
-            text="New Event",
-            command=self.place_new_event,
-            bg="#0066b4", fg="#ffd500",
-            font=button_font
+    def _build_new_events(self):
+        '''creates create new event widgets, only done the first time they are put on screen'''
 
-        )
-        self.widgets['new_events'].grid(row=4, column=0, sticky='news')
-        self.new_events_widgets = OrderedDict()
+        self.new_events_widgets = {}
 
         # Sub-Feature #4.1
-        self.new_events_widgets['new_event'] = (
+        self.new_events_widgets['new_event'] = SubFeature(
             tk.LabelFrame(
                 self.widgets['feature_frame'],
                 text="Create a new event".title(),
-                font=frame_l_font,
+                font=self.frame_l_font,
                 foreground='red',
-            ),
-            OrderedDict()
+                **self.labelframe_color[0]
+            )
         )
-        self.new_events_widgets['new_event'][1]['name'] = LabelInput(
-            self.new_events_widgets['new_event'][0],
+        self.new_events_widgets['new_event'].widgets['name'] = LabelInput(
+            self.new_events_widgets['new_event'].frame,
             "Event Name",
             input_var=tk.StringVar(),
             input_args={'style': 'text_field.TEntry'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.new_events_widgets['new_event'][1]['type'] = LabelInput(
-            self.new_events_widgets['new_event'][0],
+        self.new_events_widgets['new_event'].widgets['type'] = LabelInput(
+            self.new_events_widgets['new_event'].frame,
             "Event Type",
             ValidatedCombobox,
             tk.StringVar(),
             {"values": ["Birthday", "Marriage Anniversary",
                         "Appointment", "Meeting", "N/A"], 'style': 'text_field.TCombobox'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.new_events_widgets['new_event'][1]['date'] = LabelInput(
-            self.new_events_widgets['new_event'][0],
+        self.new_events_widgets['new_event'].widgets['date'] = LabelInput(
+            self.new_events_widgets['new_event'].frame,
             "Date of Event",
             input_class=DateInput,
             input_var=tk.StringVar(),
-            input_args={"locale": 'en_US', "date_pattern": 'yyyy-MM-dd'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.new_events_widgets['new_event'][1]['timings'] = (
+        self.new_events_widgets['new_event'].widgets['timings'] = (
             LabelInput(
-                self.new_events_widgets['new_event'][0],
+                self.new_events_widgets['new_event'].frame,
                 "Event Start Time",
                 input_class=TimeEntry,
                 input_var=tk.StringVar(),
-                label_args={'font': label_font,
-                            "style": 'label_style_0.TLabel'}
+                label_args=self.label_args[0]
             ),
             LabelInput(
-                self.new_events_widgets['new_event'][0],
+                self.new_events_widgets['new_event'].frame,
                 "Event End Time",
                 input_class=TimeEntry,
                 input_var=tk.StringVar(),
-                label_args={'font': label_font,
-                            "style": 'label_style_0.TLabel'}
+                label_args=self.label_args[0]
             )
         )
-        self.new_events_widgets['new_event'][1]['recurring'] = LabelInput(
-            self.new_events_widgets['new_event'][0],
+        self.new_events_widgets['new_event'].widgets['recurring'] = LabelInput(
+            self.new_events_widgets['new_event'].frame,
             "Is it a recurring event?",
             ValidatedCombobox,
             tk.StringVar(),
             {"values": ["Yes", "No"], 'style': 'text_field.TCombobox'},
-            label_args={'font': label_font, "style": 'label_style_0.TLabel'}
+            label_args=self.label_args[0]
         )
-        self.new_events_widgets['new_event'][1]['submit'] = ttk.Button(
-            self.new_events_widgets['new_event'][0],
+        self.new_events_widgets['new_event'].widgets['submit'] = ttk.Button(
+            self.new_events_widgets['new_event'].frame,
             text="Process",
             style='process.TButton',
-            command=partial(self.submit, 4.0)
+            command=self._submit_new_event
         )
 
-        # Feature #5: Show Calendar
-        self.widgets['show_calendar'] = tk.Button(
-            mainframe,
-            text="Show Calendar of Year/Month",
-            command=self.place_show_calendar,
-            bg="#0066b4", fg="#ffd500",
-            font=button_font
+    def _build_show_calendar(self):
+        '''creates show calendar widgets, only done the first time they are put on screen'''
 
-        )
-        self.widgets['show_calendar'].grid(row=5, column=0, sticky='news')
-        self.show_calendar_widgets = OrderedDict()
+        today_date = dt.date.today()
+
+        self.show_calendar_widgets = {}
 
         # Sub-Feature #5.1
-        self.show_calendar_widgets['calendar'] = (
+        self.show_calendar_widgets['calendar'] = SubFeature(
             tk.LabelFrame(
                 self.widgets['feature_frame'],
                 text="Calendar Window",
-                font=frame_l_font,
+                font=self.frame_l_font,
                 foreground='red',
-            ),
-            OrderedDict()
+                **self.labelframe_color[0]
+            )
         )
 
-        self.show_calendar_widgets['calendar'][1]['calendar_win'] = Calendar(
-            self.show_calendar_widgets['calendar'][0],
+        self.show_calendar_widgets['calendar'].widgets['calendar_win'] = Calendar(
+            self.show_calendar_widgets['calendar'].frame,
             selectmode='day',
             year=today_date.year,
             month=today_date.month,
             day=today_date.day,
             background="#5c88c5",
-            font=label_font,
+            font=self.label_font,
             selectforeground='#191970',
             normalforeground="#FDFEFF",
             normalbackground="#343434",
@@ -665,208 +904,239 @@ class Window(tk.Frame):
             othermonthweforeground="#eeeade",
         )
 
-        # Feature #6: Show current events in program
-        self.widgets['show_current_events'] = tk.Button(
-            mainframe,
-            text='Show Events',
-            command=self.place_show_event,
-            bg="#0066b4", fg="#ffd500",
-            font=button_font
+    def _build_show_current_events(self):
+        '''creates show events widgets, only done the first time they are put on screen'''
 
-        )
-        self.widgets['show_current_events'].grid(
-            row=6, column=0, sticky='news')
-        self.show_current_events_widgets = OrderedDict()
+        self.show_current_events_widgets = {}
 
         # Sub-Feature #6.1
-        # give it appropriate styling
-        self.style.configure("tree_style.Treeview", highlightthickness=0, bd=0, font=(
-            'Arvo', 10))  # Modify the font of the body
-        self.style.configure("tree_style.Treeview.Heading", font=(
-            'Catamaran SemiBold', 12, 'bold'))  # Modify the font of the headings
-        self.style.layout("tree_style.Treeview", [
-            ('tree_style.Treeview.treearea', {'sticky': 'news'})])  # Remove the borders
-
-        self.column_defs = {
-            '#0': {'label': 'Row', 'anchor': tk.W, 'width': 40},
-            'name': {'label': 'Name', 'width': 150, 'stretch': True},
-            'type': {'label': 'Type', 'width': 90, 'stretch': True},
-            'date': {'label': 'Date', 'width': 90},
-            'recurring': {'label': 'Recurring', 'width': 70},
-            'start_timing': {'label': "Start Time", 'width': 90},
-            'end_timing': {'label': "End Time", 'width': 90},
-        }
-        self.default_width = 100
-        self.default_minwidth = 10
-        self.deafault_anchor = tk.CENTER
-
-        self.show_current_events_widgets['csv_tree'] = (
+        self.show_current_events_widgets['csv_tree'] = SubFeature(
             ttk.Frame(
                 self.widgets['feature_frame'],
-            ),
-            OrderedDict()
+            )
         )
-        self.show_current_events_widgets['csv_tree'][1]['tree'] = ttk.Treeview(
-            self.show_current_events_widgets['csv_tree'][0],
-            columns=list(self.column_defs.keys())[1:],
+        self.show_current_events_widgets['csv_tree'].widgets['tree'] = ttk.Treeview(
+            self.show_current_events_widgets['csv_tree'].frame,
+            columns=self.value_columns,
             selectmode='browse',
             style='tree_style.Treeview',
         )
-        self.show_current_events_widgets['csv_tree'][1]['tree'].columnconfigure(
-            0, weight=1
-        )
-        self.show_current_events_widgets['csv_tree'][1]['tree'].rowconfigure(
-            0, weight=1
-        )
-
         for name, definition in self.column_defs.items():
-            label = definition.get('label', '')
-            anchor = definition.get('anchor', self.deafault_anchor)
-            minwidth = definition.get(
-                'minwidth',
-                self.default_minwidth
-            )
-            width = definition.get('width', self.default_width)
-            stretch = definition.get('stretch', False)
-            self.show_current_events_widgets['csv_tree'][1]['tree'].heading(
-                name, text=label, anchor=anchor)
-            self.show_current_events_widgets['csv_tree'][1]['tree'].column(
+            self.show_current_events_widgets['csv_tree'].widgets['tree'].heading(
+                name, text=definition['label'], anchor=definition['anchor'])
+            self.show_current_events_widgets['csv_tree'].widgets['tree'].column(
                 name,
-                anchor=anchor,
-                minwidth=minwidth,
-                width=width,
-                stretch=stretch
+                anchor=definition['anchor'],
+                minwidth=definition['minwidth'],
+                width=definition['width'],
+                stretch=definition['stretch']
             )
 
-        self.show_current_events_widgets['csv_tree'][1]['scrollbar_x'] = ttk.Scrollbar(
-            self.show_current_events_widgets['csv_tree'][0],
+        self.show_current_events_widgets['csv_tree'].widgets['scrollbar_x'] = ttk.Scrollbar(
+            self.show_current_events_widgets['csv_tree'].frame,
             orient=tk.HORIZONTAL,
-            command=self.show_current_events_widgets['csv_tree'][1]['tree'].xview
+            command=self.show_current_events_widgets['csv_tree'].widgets['tree'].xview
         )
-        self.show_current_events_widgets['csv_tree'][1]['scrollbar_y'] = ttk.Scrollbar(
-            self.show_current_events_widgets['csv_tree'][0],
+        self.show_current_events_widgets['csv_tree'].widgets['scrollbar_y'] = ttk.Scrollbar(
+            self.show_current_events_widgets['csv_tree'].frame,
             orient=tk.VERTICAL,
-            command=self.show_current_events_widgets['csv_tree'][1]['tree'].yview
+            command=self.show_current_events_widgets['csv_tree'].widgets['tree'].yview
         )
 
-        self.show_current_events_widgets['csv_tree'][1]['tree'].configure(
-            xscrollcommand=self.show_current_events_widgets['csv_tree'][1]['scrollbar_x'].set,
-            yscrollcommand=self.show_current_events_widgets['csv_tree'][1]['scrollbar_y'].set
+        self.show_current_events_widgets['csv_tree'].widgets['tree'].configure(
+            xscrollcommand=self.show_current_events_widgets['csv_tree'].widgets['scrollbar_x'].set,
+            yscrollcommand=self.show_current_events_widgets['csv_tree'].widgets['scrollbar_y'].set
         )
 
-        # placing the mainframe and feature_frame
-        mainframe.grid(row=0, sticky=(tk.S + tk.N))
-        self.widgets['feature_frame'].grid(
-            row=0, column=1, rowspan=7, columnspan=3, padx=30)
-
-        # disable some features of guest account
-        if self.user == 'guest':
-            self.widgets['show_current_events'].config(state='disabled')
-            self.widgets['new_events'].config(state='disabled')
+        # values of every row currently in tree by its iid, used to only touch rows which changed
+        self._events_by_iid = {}
 
     def place_date_calculator(self):
         '''puts date calculator widgets on screen'''
 
-        self._constructor(
-            self.date_calculator_widgets,
-            self.widgets['feature_frame']
-        )
+        if self.date_calculator_widgets is None:
+            self._build_date_calculator()
+
+        self._constructor(self.date_calculator_widgets)
 
     def place_time_calculator(self):
         '''puts time calculator widgets on screen'''
 
-        self._constructor(
-            self.time_calculator_widgets,
-            self.widgets['feature_frame']
-        )
+        if self.time_calculator_widgets is None:
+            self._build_time_calculator()
+
+        self._constructor(self.time_calculator_widgets)
 
     def place_unit_convert(self):
         '''puts unit convertor widgets on screen'''
 
-        self._constructor(
-            self.unit_conversion_widgets,
-            self.widgets['feature_frame']
-        )
+        if self.unit_conversion_widgets is None:
+            self._build_unit_conversion()
+
+        self._constructor(self.unit_conversion_widgets)
 
     def place_new_event(self):
         '''puts create new event widgets on screen'''
 
-        self._constructor(
-            self.new_events_widgets,
-            self.widgets['feature_frame']
-        )
+        if self.new_events_widgets is None:
+            self._build_new_events()
+
+        self._constructor(self.new_events_widgets)
 
     def place_show_calendar(self):
         '''puts show calendar widgets on screen'''
 
-        self._constructor(
-            self.show_calendar_widgets,
-            self.widgets['feature_frame']
-        )
+        if self.show_calendar_widgets is None:
+            self._build_show_calendar()
+
+        self._constructor(self.show_calendar_widgets)
         # if users-csv exists then mark events in the calendar
-        if os.path.exists(self.file_name):
-            with open(self.file_name) as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.show_calendar_widgets['calendar'][1]['calendar_win'].calevent_create(
-                        dt.datetime.strptime(row['date'], '%Y-%m-%d'),
-                        row['name'],
-                        row['type']
-                    )
+        try:
+            rows = self._load_events()
+        except FileNotFoundError:
+            return
+
+        # same list is returned while file is unchanged, so events marked last time are still valid
+        if rows is self._marked_events:
+            return
+
+        date_index, name_index, type_index = (
+            self.value_columns.index('date'), self.value_columns.index('name'), self.value_columns.index('type'))
+        calendar_win = self.show_calendar_widgets['calendar'].widgets['calendar_win']
+        calevent_create = calendar_win.calevent_create
+        calendar_win.calevent_remove('all')
+        for row in rows:
+            calevent_create(
+                parse_date(row[date_index]),
+                row[name_index],
+                row[type_index]
+            )
+        self._marked_events = rows
 
     def place_show_event(self):
         '''puts display all current events for current user on screen'''
 
-        if os.path.exists(self.file_name):
-
-            Window.destroyer(self.widgets['feature_frame'])
-            self.widgets['feature_frame'].config(width=500)
-
-            self.show_current_events_widgets['csv_tree'][1]['scrollbar_x'].pack(
-                side=tk.RIGHT, fill=tk.Y
-            )
-            self.show_current_events_widgets['csv_tree'][1]['scrollbar_x'].pack(
-                side=tk.BOTTOM, fill=tk.X
-            )
-            self.show_current_events_widgets['csv_tree'][1]['tree'].pack()
-            self.show_current_events_widgets['csv_tree'][0].grid(row=0)
-            # populate the tree with current user's event data
-            if os.path.exists(self.file_name):
-                with open(self.file_name) as file:
-                    reader = csv.DictReader(file)
-                    data = list(reader)
-
-            self.populate(data)
-        else:
+        try:
+            rows = self._load_events()
+        except FileNotFoundError:
             message = f"No event has been created by {self.user}"
             messagebox.showerror(
                 title="CSV file not found",
                 message=message
             )
+            return
 
-    def populate(self, rows):
-        '''Clear the treeview & write the supplied data rows to it.'''
+        if self.show_current_events_widgets is None:
+            self._build_show_current_events()
 
-        # clear the tree
-        for row in self.show_current_events_widgets['csv_tree'][1]['tree'].get_children():
-            self.show_current_events_widgets['csv_tree'][1]['tree'].delete(row)
+        self._hide_active_feature()
+        self.widgets['feature_frame'].config(width=500)
 
-        valuekeys = list(self.column_defs.keys())[1:]
-        for row_num, row_data in enumerate(rows):
-            values = [row_data[key] for key in valuekeys]
-            self.show_current_events_widgets['csv_tree'][1]['tree'].insert(
-                '', 'end', iid=str(row_num), text=str(row_num + 1), values=values)
+        self.show_current_events_widgets['csv_tree'].widgets['scrollbar_x'].pack(
+            side=tk.RIGHT, fill=tk.Y
+        )
+        self.show_current_events_widgets['csv_tree'].widgets['scrollbar_x'].pack(
+            side=tk.BOTTOM, fill=tk.X
+        )
+        self.show_current_events_widgets['csv_tree'].widgets['tree'].pack()
+        self.show_current_events_widgets['csv_tree'].frame.grid(row=0)
+        self._active_frames.append(self.show_current_events_widgets['csv_tree'].frame)
+        # populate the tree with current user's event data
+        self.populate(rows)
+
+    def _load_events(self) -> list:
+        '''
+        returns rows of current user's csv file as tuples of values in order of value_columns,
+        file is read again only if it changed since last time
+        '''
 
-        if len(rows) > 0:
-            self.show_current_events_widgets['csv_tree'][1]['tree'].focus_set()
-            self.show_current_events_widgets['csv_tree'][1]['tree'].selection_set(
-                0)
-            self.show_current_events_widgets['csv_tree'][1]['tree'].focus('0')
+        file_stat = os.stat(self.file_name)
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
 
-    def submit(self, feature_id: float):
+        if self._events_cache is None or self._events_cache[0] != file_key:
+            with _open_csv(self.file_name) as file:
+                reader = csv.reader(file)
+                columns = {name: index for index, name in enumerate(next(reader, ()))}
+
+                # empty file or one without proper header has no events, just like DictReader gave none
+                if all(key in columns for key in self.value_columns):
+                    value_indexes = [columns[key] for key in self.value_columns]
+                    # blank lines come as empty rows, DictReader skipped those too
+                    rows = [tuple(row[index] for index in value_indexes) for row in reader if row]
+                else:
+                    rows = []
+                self._events_cache = (file_key, rows)
+
+        return self._events_cache[1]
+
+    def populate(self, rows_values: list):
+        '''Make the treeview show the supplied rows of values, only rows which changed are updated.'''
+
+        tree = self.show_current_events_widgets['csv_tree'].widgets['tree']
+        tree_item = tree.item
+        shown = self._events_by_iid
+
+        # remove rows which are no longer in the data, all in a single call
+        stale = list(shown)[len(rows_values):]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del shown[iid]
+
+        # Tk only redraws once control is back in the event loop, so changes below are painted together
+        new_rows = []
+        for row_num, values in enumerate(rows_values):
+            iid = str(row_num)
+            old_values = shown.get(iid)
+            if old_values is None:
+                # shown rows are always the first ones, so new rows go to the end of tree
+                new_rows.extend((iid, str(row_num + 1), values))
+                shown[iid] = values
+            elif old_values != values:
+                tree_item(iid, values=values)
+                shown[iid] = values
+
+        # all new rows are handed over to Tcl in one call, instead of one insert per row
+        if new_rows:
+            tree.tk.call('apply', _TCL_INSERT_ROWS, str(tree), tuple(new_rows))
+
+        if len(rows_values) > 0:
+            tree.focus_set()
+            tree.selection_set(0)
+            tree.focus('0')
+
+    def _insert_event_row(self, row_num: int, values: tuple):
+        '''adds a single event at given row of treeview'''
+
+        iid = str(row_num)
+        self.show_current_events_widgets['csv_tree'].widgets['tree'].insert(
+            '', row_num, iid=iid, text=str(row_num + 1), values=values)
+        self._events_by_iid[iid] = values
+
+    # process buttons of every sub-feature, each one passes its (main_feature, sub_feature) ids to submit
+    def _submit_day_difference(self):
+        self.submit(1, 1)
+
+    def _submit_date_after_period(self):
+        self.submit(1, 2)
+
+    def _submit_time_difference(self):
+        self.submit(2, 1)
+
+    def _submit_time_after_increment(self):
+        self.submit(2, 2)
+
+    def _submit_unit_conversion(self):
+        self.submit(3, 1)
+
+    def _submit_new_event(self):
+        self.submit(4, 1)
+
+    def submit(self, main_feat_id: int, sub_feat_id: int):
         '''
         processing button for all features and sub-features in application
-            feature_id: main_feature.sub_feature --> like 1.1 is for date calculator's day difference b/w dates
+            main_feat_id, sub_feat_id: number of feature & its sub-feature --> like 1, 1 is for
+            date calculator's day difference b/w dates
         '''
 
         # mapping every feature by its feature id
@@ -877,69 +1147,54 @@ class Window(tk.Frame):
             4: self.new_events_widgets,
         }
 
-        main_feat_id: int = int(feature_id)
-        sub_feat_id: int = int(str(feature_id)[-1])
-
         # making a dict of widgets of feature chosen
-        # working -> takes value of main feature widget dict, which is tuple of len 2
-        # takes decimal place of of feature id which is number of sub-feature, subtracts 1 from it
-        # cuz of 0 indexing and chooses last element of that sub-feature tuple cuz first element is
-        # container obj and finally converting it to list
+        # working -> takes values of main feature widget dict, which are SubFeature objects
+        # takes number of sub-feature, subtracts 1 from it
+        # cuz of 0 indexing and chooses widgets of that sub-feature
         req_dict = list(widget_dict[main_feat_id].values())[
-            sub_feat_id - 1][-1]
+            sub_feat_id - 1].widgets
 
         # gets string value from each entry filed of sub-feature chosen in dict form
         req_data = self.get(req_dict)
 
+        # output field may be stored in a tuple, feature functions need the field itself
+        output = req_dict.get('output')
+        if isinstance(output, tuple):
+            output = output[0]
+
         # passing necessary inputs to each respective feature's function in form demanded
-        # by the functions
+        # by the functions, only errors caused by invalid input are reported to user
         try:
-            if main_feat_id == 1:
-                if isinstance(req_dict['output'], tuple):
-                    self.date_calc(
-                        sub_feat_id,
-                        req_dict['output'][0],
-                        **req_data
-                    )
-                else:
-                    self.date_calc(
-                        sub_feat_id,
-                        req_dict['output'],
-                        **req_data
-                    )
-            elif main_feat_id == 2:
-                if isinstance(req_dict['output'], tuple):
-                    self.time_calc(
-                        sub_feat_id,
-                        req_dict['output'][0],
-                        **req_data
-                    )
-                else:
-                    self.time_calc(
-                        sub_feat_id,
-                        req_dict['output'],
-                        **req_data
-                    )
-            elif main_feat_id == 3:
-                self.unit_converter(req_data, req_dict['output'][0])
-
-            elif main_feat_id == 4:
-                if self.create_new_event(req_data):
-                    messagebox.showinfo(
-                        title="Event Created Successfully",
-                        message=f"The event is successfully created to {self.file_name}"
-                    )
-                else:
-                    messagebox.showerror(
-                        title="Event not created",
-                        message="The event could not be created for some reason."
-                    )
-        except Exception:
+            self._submit_dispatch[main_feat_id](sub_feat_id, output, req_data)
+        except (ValueError, KeyError, OverflowError):
             messagebox.showerror(
                 title="Error Occurred",
                 message="Invalid input. Try again."
             )
 
+    def _submit_event(self, sub_feat_id: int, output, data: dict):
+        '''creates new event and tells user whether it worked'''
+
+        try:
+            created = self.create_new_event(data)
+        except OSError as error:
+            messagebox.showerror(
+                title="Event not created",
+                message=f"The event could not be saved to {self.file_name}.\n{error}"
+            )
+            return
+
+        if created:
+            messagebox.showinfo(
+                title="Event Created Successfully",
+                message=f"The event is successfully created to {self.file_name}"
+            )
+        else:
+            messagebox.showerror(
+                title="Event not created",
+                message="The event could not be created for some reason."
+            )
+
     def unit_converter(self, data: dict, to_update_in):
         '''worker function for unit convertor feature'''
 
@@ -950,11 +1205,14 @@ class Window(tk.Frame):
         )
         output = calc_obj.output()
 
-        # update the output value on screen in disabled entry box
+        # update the output value on screen in its read-only label
         to_update_in.set(f"{output}")
 
     def create_new_event(self, data: dict) -> bool:
-        '''creates a new event for current user in curr user csv file'''
+        '''
+        creates a new event for current user in curr user csv file,
+        raises OSError if the file couldn't be written
+        '''
 
         if self.user == 'guest':
             return False
@@ -964,16 +1222,42 @@ class Window(tk.Frame):
         data['start_timing'] = start_time
         data['end_timing'] = end_time
 
-        # checking if file already exits
-        newfile: bool = not os.path.exists(self.file_name)
+        self._write_event(data)
 
-        with open(self.file_name, 'a', newline='') as fn:
-            csv_writer = csv.DictWriter(fn, fieldnames=data.keys())
-            if fn.writable():
-                if newfile:
-                    csv_writer.writeheader()
-                csv_writer.writerow(data)
-                return True
+        # if events are already in treeview, just add the new one instead of refreshing the whole tree
+        if self.show_current_events_widgets is not None:
+            self._insert_event_row(
+                len(self._events_by_iid),
+                tuple(data[key] for key in self.value_columns)
+            )
+        return True
+
+    def _write_event(self, data: dict):
+        '''appends a single event to current user's csv file, raising OSError if it couldn't be written'''
+
+        try:
+            if self._events_writer is None:
+                self._events_file = _open_csv(self.file_name, 'a')
+                self._events_writer = csv.DictWriter(self._events_file, fieldnames=data.keys())
+                # file opened for appending starts at its end, so nothing has been written yet if that is 0
+                if self._events_file.tell() == 0:
+                    self._events_writer.writeheader()
+
+            self._events_writer.writerow(data)
+            # pushing row out of the buffer, so that it is saved before user is told so
+            self._events_file.flush()
+        except OSError:
+            # a broken file is opened again on next event
+            self._close_events_file()
+            raise
+
+    def _close_events_file(self, *args):
+        '''closes user's csv file if it was opened for writing'''
+
+        # forgetting the file first, so it is opened again even if closing it fails
+        events_file, self._events_file, self._events_writer = self._events_file, None, None
+        if events_file is not None:
+            events_file.close()
 
     @staticmethod
     def get(where_from: dict) -> dict:
@@ -981,28 +1265,22 @@ class Window(tk.Frame):
 
         data = {}
         for key, widget in where_from.items():
-            try:
-                data[key] = widget.get()
-            except AttributeError:
-                # got a button instead of an entry field or a tuple
-                data[key] = list()
-                try:
-                    for wid in widget:
-                        data[key].append(wid.get())
-                except Exception:
-                    # got a button
-                    continue
-
+            # submit button has no data
+            if key == 'submit':
                 continue
-        data.pop('submit')
+            # fields placed side by side are stored as tuple
+            if isinstance(widget, tuple):
+                data[key] = [wid.get() for wid in widget]
+            else:
+                data[key] = widget.get()
 
         return data
 
     def date_calc(self, feature_code: int, to_update_in, **kwargs):
         '''have all features offered by date calculator'''
 
-        # let all the processing be handled by class created for this purpose
-        calc_obj = DateCalc()
+        # let all the processing be handled by class created for this purpose, it holds no state
+        calc_obj = DateCalc
 
         # days between two dates
         if feature_code == 1:
@@ -1019,8 +1297,8 @@ class Window(tk.Frame):
     def time_calc(self, feature_code: int, to_update_in, **kwargs):
         '''have all features offered by time calculator'''
 
-        # let all the processing be handled by class created for this purpose
-        calc_obj = TimeCalc()
+        # let all the processing be handled by class created for this purpose, it holds no state
+        calc_obj = TimeCalc
 
         # time difference between two time stamps
         if feature_code == 1:
@@ -1038,78 +1316,66 @@ class Window(tk.Frame):
                 f"{calc_obj.time_increment(kwargs['time'], int(kwargs['seconds_to_increment'][0]), kwargs['seconds_to_increment'][1])}"
             )  # update the output
 
-    def _constructor(self, what_to_construct: dict, frame_to_clear: tk.Frame):
+    def _constructor(self, what_to_construct: dict):
         '''puts sub-features of clicked feature on screen'''
 
         # syntax of what_to_construct dictionary
-        # {sub_feature: (sub_feature_container, sub_feature_widgets)}
+        # {sub_feature: SubFeature(sub_feature_container, sub_feature_widgets)}
 
-        # using destroyer func defined in window
-        Window.destroyer(frame_to_clear)
+        self._hide_active_feature()
 
         sub_feature_label_row = 0  # no need to define column in single column grid
-        for container_obj, feature_widgets in what_to_construct.values():
-
-            # put container obj first on screen
-            container_obj.config(
-                **self.labelframe_color[sub_feature_label_row])
-            container_obj.grid(row=sub_feature_label_row,
-                               column=0, sticky="news")
+        for sub_feature in what_to_construct.values():
+            container_obj, feature_widgets = sub_feature.frame, sub_feature.widgets
 
+            if sub_feature.laid_out:
+                # grid remembers options of removed widgets, fields inside container are still in place
+                container_obj.grid()
+            else:
+                # put container obj first on screen, its colour is set when it is built
+                container_obj.grid(row=sub_feature_label_row,
+                                   column=0, sticky="news")
+                Window._lay_out_fields(feature_widgets)
+                sub_feature.laid_out = True
+            Window._clear_fields(feature_widgets)
+
+            self._active_frames.append(container_obj)
             sub_feature_label_row += 1
 
-            # declaring vars for fields of sub features
-            _sub_feature_field_row, _sub_feature_field_column = 0, 0
-
-            # taking values cuz key is just name of widget
-            for object_to_grid in feature_widgets.values():
-                try:
-                    # only input-type supports set method so only applying it on those
-                    if isinstance(object_to_grid, (ttk.Combobox, LabelInput)):
-                        object_to_grid.grid(
-                            row=_sub_feature_field_row,
-                            column=_sub_feature_field_column,
-                            sticky='ew',
-                            pady=(10, 0),
-                        )
-                        object_to_grid.set('')
-                    elif isinstance(object_to_grid, Calendar):
-                        object_to_grid.grid(
-                            row=_sub_feature_field_row,
-                            column=_sub_feature_field_column,
-                            pady=(10, 0),
-                            ipadx=100,
-                            ipady=60,
-                        )
-                    else:
-                        object_to_grid.grid(
-                            row=_sub_feature_field_row,
-                            column=_sub_feature_field_column,
-                            sticky='ew',
-                            pady=(10, 0),
-                            ipady=5,
-                            ipadx=5,
-                            columnspan=2,
-                        )
-                except AttributeError:
-                    # object_to_grid is tuple cuz we encountered fields stacked side by side
-                    unit_column = 0
-
-                    # iterating over tuple
-                    for obj in object_to_grid:
-                        obj.grid(
-                            row=_sub_feature_field_row,
-                            column=unit_column,
-                            sticky='news',
-                            pady=(10, 0)
-                        )
-
-                        if type(obj) in (ttk.Combobox, LabelInput):
-                            obj.set('')
-                        unit_column += 1
-                finally:
-                    # have to increase row after every iteration even when no error
-                    _sub_feature_field_row += 1
+    def _hide_active_feature(self):
+        '''removes frames of feature currently on screen from view, keeping their grid options'''
+
+        for frame in self._active_frames:
+            frame.grid_remove()
+        self._active_frames = []
+
+    @staticmethod
+    def _clear_fields(feature_widgets: dict):
+        '''empties every input field of a sub-feature'''
+
+        for object_to_clear in feature_widgets.values():
+            fields = object_to_clear if isinstance(object_to_clear, tuple) else (object_to_clear,)
+            for obj in fields:
+                # only input-type supports set method so only applying it on those
+                if isinstance(obj, (ttk.Combobox, LabelInput)):
+                    obj.set('')
+
+    @classmethod
+    def _lay_out_fields(cls, feature_widgets: dict):
+        '''grids fields of a sub-feature inside its container, done only the first time it is shown'''
+
+        # taking values cuz key is just name of widget, every field or tuple of fields gets its own row
+        for field_row, object_to_grid in enumerate(feature_widgets.values()):
+            if isinstance(object_to_grid, tuple):
+                # fields stacked side by side
+                for unit_column, obj in enumerate(object_to_grid):
+                    obj.grid(row=field_row, column=unit_column, **cls.side_by_side_grid_options)
+            else:
+                object_to_grid.grid(
+                    row=field_row,
+                    column=0,
+                    **cls.grid_options.get(type(object_to_grid), cls.default_grid_options)
+                )
 
     @staticmethod
     def destroyer(frame: tk.Frame):
@@ -1122,6 +1388,9 @@ class Window(tk.Frame):
 class LoginPage(tk.Frame):
     '''Sets the login page for all types of login'''
 
+    # users of users csv file by user id along with file's stat, shared by every login page
+    _users_cache = None
+
     def __init__(self, which_login: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -1130,40 +1399,18 @@ class LoginPage(tk.Frame):
             'label.TLabel',
             background="#f8a51b"
         )
-        default_font = nametofont('TkTextFont')
-        default_font.config(
-            family="ds-digital",
-            weight='normal',
-            size=15
-        )
-        self.text_field = Font(
-            family="Fira Code",
-            size=15,
-            weight='normal',
-            slant='roman'
-        )
+        resources = _get_resources(self)
+        self.text_field = resources['text_field']
         self.style.configure(
             'text.TEntry',
             font=self.text_field,
         )
 
-        self.label_font = Font(
-            family='Catamaran SemiBold',
-            size=11,
-            weight='normal',
-            slant='roman',
-        )
-        self.frame_l_font = Font(
-            family="Arvo",
-            size=15,
-            weight='normal',
-            slant='italic',
-        )
-        self.process_font = Font(
-            family='Cascadia Code Bold',
-            size=13,
-            slant='roman'
-        )
+        self.label_font = resources['label_font']
+        self.frame_l_font = resources['frame_l_font']
+        self.process_font = resources['process_font']
+        # label arguments shared by every LabelInput of login page
+        self.label_args = {'font': self.label_font, 'style': 'label.TLabel'}
         self.style.configure(
             "processor.TButton",
             font=self.process_font,
@@ -1172,6 +1419,31 @@ class LoginPage(tk.Frame):
 
         # list of all widgets
         self.widgets = dict()
+        self.login_frame = None
+
+        self.file_name = os.path.join(
+            os.path.expanduser('~'), "Documents",
+            "users.csv"
+        )
+
+        # widgets of requested login are created by grid, when login page is first put on screen
+        self._which_login = which_login
+
+    def grid(self, *args, **kwargs):
+        '''puts login page on screen, creating widgets of requested login the first time'''
+
+        if self._which_login is not None:
+            which_login, self._which_login = self._which_login, None
+            self._build_login(which_login)
+        super().grid(*args, **kwargs)
+
+    def _build_login(self, which_login: str):
+        '''creates widgets of requested login'''
+
+        # guest goes straight to calendar application, so it doesn't need a login frame
+        if which_login == 'guest_login':
+            self.guest_login()
+            return
 
         self.login_frame = tk.LabelFrame(
             self,
@@ -1181,17 +1453,10 @@ class LoginPage(tk.Frame):
             background="#f8a51b")
         self.login_frame.grid(row=0, column=0, sticky=(tk.W + tk.E))
 
-        self.file_name = os.path.join(
-            os.path.expanduser('~'), "Documents",
-            "users.csv"
-        )
-
         if which_login == 'new_user_login':
             self.new_user_login()
         elif which_login == 'existing_user_login':
             self.existing_user_login()
-        elif which_login == 'guest_login':
-            self.guest_login()
 
     def existing_user_login(self):
         '''declaring widgets for login designed for existing user'''
@@ -1200,7 +1465,7 @@ class LoginPage(tk.Frame):
             self.login_frame,
             "User ID",
             input_class=RequiredEntry,
-            label_args={'font': self.label_font, 'style': 'label.TLabel'},
+            label_args=self.label_args,
             input_var=tk.StringVar(),
 
         )
@@ -1211,7 +1476,7 @@ class LoginPage(tk.Frame):
             "Password",
             input_class=RequiredEntry,
             input_var=tk.StringVar(),
-            label_args={'font': self.label_font, "style": "label.TLabel"}
+            label_args=self.label_args
         )
         self.widgets['password'].grid(row=1, column=0, columnspan=2)
 
@@ -1219,7 +1484,7 @@ class LoginPage(tk.Frame):
             self.login_frame,
             text="Sumbit & next",
             style="processor.TButton",
-            command=partial(self.read_user, self.widgets)
+            command=lambda: self.read_user(self.widgets)
         )
         self.widgets['submit'].grid(row=2, column=0, columnspan=2)
 
@@ -1231,7 +1496,7 @@ class LoginPage(tk.Frame):
             "User-Name",
             input_class=RequiredEntry,
             input_var=tk.StringVar(),
-            label_args={'font': self.label_font, 'style': 'label.TLabel'}
+            label_args=self.label_args
         )
         self.widgets['name'].grid(row=0, column=0, columnspan=2)
 
@@ -1239,9 +1504,8 @@ class LoginPage(tk.Frame):
             self.login_frame,
             "Birth date",
             input_class=DateInput,
-            input_args={"locale": 'en_US', "date_pattern": 'yyyy-MM-dd'},
             input_var=tk.StringVar(),
-            label_args={'font': self.label_font, 'style': 'label.TLabel'}
+            label_args=self.label_args
         )
         self.widgets['birth_date'].grid(row=1, column=0, columnspan=2)
 
@@ -1250,7 +1514,7 @@ class LoginPage(tk.Frame):
             "User ID",
             input_class=RequiredEntry,
             input_var=tk.StringVar(),
-            label_args={'font': self.label_font, 'style': 'label.TLabel'}
+            label_args=self.label_args
         )
         self.widgets['user_id'].grid(row=2, column=0, columnspan=2)
 
@@ -1259,7 +1523,7 @@ class LoginPage(tk.Frame):
             "Password",
             input_class=RequiredEntry,
             input_var=tk.StringVar(),
-            label_args={'font': self.label_font, 'style': 'label.TLabel'}
+            label_args=self.label_args
         )
         self.widgets['password'].grid(row=3, column=0, columnspan=2)
 
@@ -1267,7 +1531,7 @@ class LoginPage(tk.Frame):
             self.login_frame,
             text="Sumbit & next",
             style='processor.TButton',
-            command=partial(self.save_user, self.widgets)
+            command=lambda: self.save_user(self.widgets)
         )
         self.widgets['submit'].grid(row=4, column=0, columnspan=2)
 
@@ -1289,17 +1553,50 @@ class LoginPage(tk.Frame):
         """verifies user id and password, once verified opens calendar application"""
 
         data = Window.get(widgets_dict)
-        if os.path.exists(self.file_name):
-            with open(self.file_name, 'r') as users_csv:
-                reader = csv.DictReader(users_csv)
-                for row in reader:
-                    if row['user_id'] == data['user_id'] and row['password'] == data['password']:
-                        self.switch_to_main_application(row['name'])
-        else:
+
+        # missing users csv file gives no users as well
+        users = self._load_users()
+        if not users:
             messagebox.showerror(
                 "user.csv file not found",
                 "Create a user first using *New user option*"
             )
+            return
+
+        user = users.get(data['user_id'])
+        if user is not None and user[0] == data['password']:
+            self.switch_to_main_application(user[1])
+
+    def _load_users(self) -> dict:
+        '''
+        returns (password, name) of every user by user id,
+        users csv file is read again only if it changed since last time
+        '''
+
+        try:
+            file_stat = os.stat(self.file_name)
+        except FileNotFoundError:
+            return {}
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        if LoginPage._users_cache is None or LoginPage._users_cache[0] != file_key:
+            with _open_csv(self.file_name) as users_csv:
+                reader = csv.reader(users_csv)
+                header = next(reader, ())
+                columns = {name: index for index, name in enumerate(header)}
+
+                # empty file or one without proper header has no users
+                if all(key in columns for key in ('user_id', 'password', 'name')):
+                    id_index, password_index, name_index = (
+                        columns['user_id'], columns['password'], columns['name'])
+                    # blank lines come as empty rows, those and incomplete rows hold no usable user
+                    users = {row[id_index]: (row[password_index], row[name_index])
+                             for row in reader if len(row) >= len(header)}
+                else:
+                    users = {}
+                LoginPage._users_cache = (file_key, users)
+
+        return LoginPage._users_cache[1]
 
     def save_user(self, widgets_dict):
         '''saves the data of new user entered'''
@@ -1307,25 +1604,19 @@ class LoginPage(tk.Frame):
         # gets data from each widget in dict form
         data = Window.get(widgets_dict)
 
+        if data['user_id'] in self._load_users():
+            messagebox.showerror(
+                "Can't create user",
+                f"{data['user_id']} already exists in database.\n"
+                "Please choose a different one."
+            )
+            return
+
         # check if users csv file exists, if it is new don't write headers
         newfile: bool = not os.path.exists(self.file_name)
 
         # append to user csv file
-        used_usernames = list()
-        with open(self.file_name, 'a+', newline='') as fn:
-            if fn.readable():
-                fn.seek(0)
-                csv_read = csv.DictReader(fn)
-                for row in csv_read:
-                    used_usernames.append(row['user_id'])
-
-                if data['user_id'] in used_usernames:
-                    messagebox.showerror(
-                        "Can't create user",
-                        f"{data['user_id']} already exists in database.\n"
-                        "Please choose a different one."
-                    )
-                    return
+        with _open_csv(self.file_name, 'a') as fn:
             csv_writer = csv.DictWriter(fn, fieldnames=data.keys())
             if newfile:
                 csv_writer.writeheader()
@@ -1350,7 +1641,7 @@ class Welcome(tk.Frame):
             self.button_frame,
             text="Already a user, click here",
             style='welcome.TButton',
-            command=partial(self.login, "existing_user_login")
+            command=lambda: self.login("existing_user_login")
         )
         self.widgets['user_login'].grid(
             sticky=tk.E, row=0, column=0, padx=(10, 20), ipadx=10, ipady=10)
@@ -1359,7 +1650,7 @@ class Welcome(tk.Frame):
             self.button_frame,
             text='Guest Login',
             style='welcome.TButton',
-            command=partial(self.login, "guest_login")
+            command=lambda: self.login("guest_login")
         )
         self.widgets['guest_login'].grid(
             sticky=tk.W, row=0, column=1, padx=(10, 20), ipadx=10, ipady=10)
@@ -1368,7 +1659,7 @@ class Welcome(tk.Frame):
             self.button_frame,
             text="New user, click here to register",
             style='welcome.TButton',
-            command=partial(self.login, "new_user_login")
+            command=lambda: self.login("new_user_login")
         )
         self.widgets['new_user'].grid(
             sticky=tk.E, row=0, column=2, padx=(10, 20), ipadx=10, ipady=10)
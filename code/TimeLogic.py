@@ -1,13 +1,62 @@
 """has all coding for time & date related queries for Py-Calendar application"""
 
+import calendar
 import datetime as dt
-from typing import Union
+from functools import lru_cache
 
 
 ##############
 # TIME LOGIC #
 ##############
 
+def parse_date(date_string: str) -> dt.date:
+    """Parses date in fixed format=[%Y-%m-%d] without going through strptime, raises ValueError otherwise"""
+
+    # fromisoformat also takes forms like 20240101 or 2024-W01-1, so the shape is checked first
+    if len(date_string) != 10 or date_string[4] != '-' or date_string[7] != '-':
+        raise ValueError(f"Date {date_string!r} is not in %Y-%m-%d format")
+
+    # C-level parser, it also rejects malformed strings that plain slicing would let through
+    return dt.date.fromisoformat(date_string)
+
+
+# same dates are parsed again and again by calculator, so parsed ones are kept
+_parse_ymd = lru_cache(maxsize=256)(parse_date)
+
+
+# necessary dict having unit: multiplier -> sec
+_IN_TO_SEC: dict = {
+    'sec': 1,
+    'min': 60,
+    'hour': 60 * 60,
+    'day(s)': 24 * 60 * 60,
+    'week(s)': 7 * 24 * 60 * 60,
+    'year(s)': 365 * 24 * 60 * 60,
+}
+
+# output unit: index into _OUT_DIVISORS, ordered from smallest to biggest unit
+_OUT_CODES: dict = {unit: code for code, unit in enumerate(_IN_TO_SEC)}
+_OUT_DIVISORS: tuple = tuple(_IN_TO_SEC.values())
+_ROUND_FROM_CODE: int = _OUT_CODES['day(s)']
+
+# unit: multiplier -> days, for date increments (anything missing is already in days)
+_DATE_MULT: dict = {
+    'week(s)': 7,
+}
+
+# unit: multiplier -> months, these can't be expressed as a fixed number of days
+_MONTH_MULT: dict = {
+    'month(s)': 1,
+    'year(s)': 12,
+}
+
+# unit: multiplier -> sec, for time increments (anything missing is already in seconds)
+_TIME_MULT: dict = {
+    'hrs': 60 * 60,
+    'min': 60,
+}
+
+
 class DateCalc:
     """Defines all that required for date calculation"""
 
@@ -15,97 +64,101 @@ class DateCalc:
         """A Basic Date Calculator"""
 
     @staticmethod
-    def day_calculator(start_date, end_date) -> int:
+    def day_calculator(start_date: str, end_date: str) -> int:
         """Gives number of days between entered dates"""
 
-        start_date = dt.datetime.strptime(start_date, "%Y-%m-%d")
-        end_date = dt.datetime.strptime(end_date, "%Y-%m-%d")
+        start_date = _parse_ymd(start_date)
+        end_date = _parse_ymd(end_date)
 
         if end_date < start_date:
             raise ValueError("End date was found to be less than start date")
-        else:
-            return (end_date - start_date).days
+        return (end_date - start_date).days
 
     @staticmethod
-    def second_calculator(start_date, end_date) -> float:
+    def day_calculator_batch(start_dates, end_dates) -> list:
+        """Gives number of days between each pair of entered dates"""
+
+        gaps = DateCalc._day_gaps(start_dates, end_dates)
+
+        if any(gap < 0 for gap in gaps):
+            raise ValueError("End date was found to be less than start date")
+        return gaps
+
+    @staticmethod
+    def second_calculator(start_date: str, end_date: str) -> int:
         """Gives number of seconds between entered date"""
 
-        start_date = dt.datetime.strptime(start_date, "%Y-%m-%d")
-        end_date = dt.datetime.strptime(end_date, "%Y-%m-%d")
+        # whole days only, so subtracting day ordinals avoids allocating a timedelta
+        return (_parse_ymd(start_date).toordinal() - _parse_ymd(end_date).toordinal()) * 86400
+
+    @staticmethod
+    def second_calculator_batch(start_dates, end_dates) -> list:
+        """Gives number of seconds between each pair of entered dates"""
 
-        return (start_date - end_date).total_seconds()
+        # same sign as second_calculator, which counts from end date to start date
+        return [-gap * 86400 for gap in DateCalc._day_gaps(start_dates, end_dates)]
 
     @staticmethod
-    def date_increment(date, increment: int, increment_unit: str) -> dt.date:
-        """Gives date after given number of days"""
+    def _day_gaps(start_dates, end_dates) -> list:
+        """Gives days from start to end date for each pair, both lists must be of same length"""
 
-        if increment_unit == 'week(s)':
-            increment *= 7
-        elif increment_unit == 'month(s)':
-            increment *= 30
-        elif increment_unit == 'year(s)':
-            increment *= 365
+        # working on day ordinals, so each pair costs one int subtraction instead of a timedelta
+        return [_parse_ymd(end).toordinal() - _parse_ymd(start).toordinal()
+                for start, end in zip(start_dates, end_dates, strict=True)]
 
-        date = dt.datetime.strptime(date, "%Y-%m-%d")
-        date += dt.timedelta(days=increment)
-        return date
+    @staticmethod
+    def date_increment(date: str, increment: int, increment_unit: str) -> dt.date:
+        """Gives date after given number of days, weeks, months or years"""
+
+        # only the date part is ever needed, so stay with dt.date rather than dt.datetime
+        date = _parse_ymd(date)
+
+        if increment_unit in _MONTH_MULT:
+            return DateCalc._add_months(date, increment * _MONTH_MULT[increment_unit])
+
+        increment *= _DATE_MULT.get(increment_unit, 1)
+        return date + dt.timedelta(days=increment)
+
+    @staticmethod
+    def _add_months(date: dt.date, months: int) -> dt.date:
+        """Moves date by given months, day is clipped to the last day of a shorter month"""
+
+        year, month_index = divmod(date.year * 12 + date.month - 1 + months, 12)
+        month = month_index + 1
+        day = min(date.day, calendar.monthrange(year, month)[1])
+        return dt.date(year, month, day)
 
 
 class TimeConvert:
     """Class for converting any amount of seconds to days, weeks, and years"""
 
-    def __init__(self, integer: int, unit: str, out_unit: str):
+    def __init__(self, integer: float, unit: str, out_unit: str):
         """Requires seconds to initiate and converts it to other units of time"""
 
-        self.num = integer
-        self.in_unit = unit
-        self.out_unit = out_unit
+        self.num: float = integer
+        self.in_unit: str = unit
+        self.out_unit: str = out_unit
+        self._out_code: int = _OUT_CODES[out_unit]
 
-        self.second = self._to_sec()
+        self.second: float = self._to_sec()
+        # units are fixed for the object, so the converted value is computed just once
+        self.value: float = self._convert()
 
-    def _to_sec(self) -> int:
+    def _to_sec(self) -> float:
         """converts given data to seconds"""
 
-        # necessary dict having unit: multiplier -> sec
-        conversion: dict = {
-            'min': 60,
-            'hour': 60 * 60,
-            'day(s)': 24 * 60 * 60,
-            'week(s)': 7 * 24 * 60 * 60,
-            'year(s)': 365 * 24 * 60 * 60,
-        }
-        return self.num * conversion[self.in_unit]
-
-    def _to_min(self) -> float:
-        """Returns sec to minutes"""
-        return self.second / 60
-
-    def _to_hour(self) -> float:
-        """Returns sec to hours"""
-        return self._to_min() / 60
-
-    def _to_days(self) -> float:
-        """Returns number of days"""
-        return round(self._to_hour() / 24, 3)
-
-    def _to_weeks(self) -> float:
-        """Returns number of weeks in int form"""
-        return round(self._to_days() / 7, 3)
-
-    def _to_year(self) -> float:
-        """Returns number of years in int form"""
-        return round(self._to_days() / 365, 3)
-
-    def output(self):
-        conversion_func = {
-            'sec': self._to_sec,
-            'min': self._to_min,
-            'hour': self._to_hour,
-            'day(s)': self._to_days,
-            'week(s)': self._to_weeks,
-            'year(s)': self._to_year
-        }
-        return conversion_func[self.out_unit]()
+        return self.num * _IN_TO_SEC[self.in_unit]
+
+    def _convert(self) -> float:
+        """Returns the seconds in output unit, days and above are rounded to 3 places"""
+
+        value = self.second / _OUT_DIVISORS[self._out_code]
+        return round(value, 3) if self._out_code >= _ROUND_FROM_CODE else value
+
+    def output(self) -> float:
+        """Returns the value converted to output unit"""
+
+        return self.value
 
 
 class TimeCalc:
@@ -118,35 +171,45 @@ class TimeCalc:
     def str_to_seconds(time_string: str) -> int:
         """Converts entered time to seconds with 00:00:00 as 0 sec for reference, format=[%i%i:%i%i:%i%i]"""
 
-        multipliers = [3600, 60, 1]
-        return sum([a * b for a, b in zip(multipliers, map(int, time_string.split(':')))])
+        # digits are turned to numbers by their ascii code, so the format has to be checked up front
+        if (len(time_string) != 8 or time_string[2] != ':' or time_string[5] != ':'
+                or not time_string.isascii() or not time_string.replace(':', '', 2).isdigit()):
+            raise ValueError(f"Time {time_string!r} is not in %H:%M:%S format")
+
+        hours = (ord(time_string[0]) - 48) * 10 + ord(time_string[1]) - 48
+        minutes = (ord(time_string[3]) - 48) * 10 + ord(time_string[4]) - 48
+        seconds = (ord(time_string[6]) - 48) * 10 + ord(time_string[7]) - 48
 
-    def time_gap(self, start_time: str, end_time: str) -> Union[int, ValueError]:
+        if not (hours < 24 and minutes < 60 and seconds < 60):
+            raise ValueError(f"Time {time_string!r} is out of range 00:00:00..23:59:59")
+        return hours * 3600 + minutes * 60 + seconds
+
+    @staticmethod
+    def time_gap(start_time: str, end_time: str) -> int:
         """Returns seconds difference between entered times"""
 
-        if dt.time.fromisoformat(start_time) > dt.time.fromisoformat(end_time):
+        # seconds since 00:00:00 keep the same ordering as the times themselves, so parse only once
+        start_seconds = TimeCalc.str_to_seconds(start_time)
+        end_seconds = TimeCalc.str_to_seconds(end_time)
+
+        if start_seconds > end_seconds:
             raise ValueError("Start time can't be bigger than end time")
-        else:
-            return self.str_to_seconds(end_time) - self.str_to_seconds(start_time)
+        return end_seconds - start_seconds
 
     @staticmethod
     def time_increment(time: str, increment: int, increment_unit: str) -> str:
         """Increments time by given seconds and returns formed string"""
 
         # changing value such that it will always give corresponding seconds
-        if increment_unit == 'hrs':
-            increment *= 3600
-        elif increment_unit == 'min':
-            increment *= 60
-
-        # removing 0 from left side so no problem occurs when converting to int
-        time: list = time.split(':')
-        time = [int(time[i].lstrip('0')) for i in range(3)]
-        hours, minutes, seconds = time
-
-        # converting above data to timedelta to do the actual increment
-        total_seconds = dt.timedelta(
-            hours=hours, minutes=minutes, seconds=seconds) + dt.timedelta(seconds=increment)
-
-        # returns string in format of "%i%i:%i%i:%i%i" if it passes a 24 hours then %i Days, same time format
-        return str(total_seconds)
+        increment *= _TIME_MULT.get(increment_unit, 1)
+
+        # doing the actual increment on plain seconds
+        total_seconds = TimeCalc.str_to_seconds(time) + increment
+
+        days, left_sec = divmod(total_seconds, 86400)
+        hours, left_sec = divmod(left_sec, 3600)
+        minutes, seconds = divmod(left_sec, 60)
+
+        # returns string in format of "%i%i:%i%i:%i%i" if it passes a 24 hours then %i day(s), same time format
+        time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return f"{days} day(s), {time}" if days else time
@@ -4,6 +4,8 @@ from tkinter import ttk
 
 from tkcalendar import DateEntry
 
+from .TimeLogic import parse_date
+
 
 ######################
 # VALIDATION CLASSES #
@@ -17,15 +19,29 @@ class ValidatedMixin:
         self.error = error_var or tk.StringVar()
         super().__init__(*args, **kwargs)
 
-        vcmd = self.register(self._validate)
-        invcmd = self.register(self._invalid)
+        vcmd, invcmd = self._validation_commands()
 
         self.config(
             validate='all',
-            validatecommand=(vcmd, '%P', '%s', '%S', '%V', '%i', '%d'),
-            invalidcommand=(invcmd, '%P', '%s', '%S', '%V', '%i', '%d'),
+            validatecommand=(vcmd, '%W', '%P', '%s', '%S', '%V', '%i', '%d'),
+            invalidcommand=(invcmd, '%W', '%P', '%s', '%S', '%V', '%i', '%d'),
         )
 
+    def _validation_commands(self):
+        """
+        Returns Tcl commands which validate any widget, registered only once per application.
+        Tk passes widget's path as first argument, which is used to call method of that widget.
+        """
+
+        root = self._root()
+        commands = getattr(root, '_validation_commands', None)
+        if commands is None:
+            commands = root._validation_commands = (
+                root.register(lambda path, *args: root.nametowidget(path)._validate(*args)),
+                root.register(lambda path, *args: root.nametowidget(path)._invalid(*args)),
+            )
+        return commands
+
     def _toggle_error(self, on=False):
         '''sets foreground colour to red if error found'''
 
@@ -118,13 +134,19 @@ class RequiredEntry(ValidatedMixin, ttk.Entry):
 class DateInput(ValidatedMixin, DateEntry):
     """An Entry for ISO-style dates (Year-month-day)"""
 
+    # shared configuration of every date field, callers may still override it
+    defaults = {'locale': 'en_US', 'date_pattern': 'yyyy-MM-dd'}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **{**self.defaults, **kwargs})
+
     def _focusout_validate(self, event):
         valid = True
         if not self.get():
             self.error.set('A value is required')
             valid = False
         try:
-            dt.datetime.strptime(self.get(), '%Y-%m-%d')
+            parse_date(self.get())
         except ValueError:
             self.error.set('Invalid date')
             valid = False
@@ -134,17 +156,21 @@ class DateInput(ValidatedMixin, DateEntry):
 class TimeEntry(ValidatedMixin, ttk.Entry):
     '''An Entry for hh:mm:ss style time'''
 
+    # check for character typed at each position of hh:mm:ss, nothing can be typed beyond it
+    _POS_VALIDATORS = {
+        '0': str.isdigit, '1': str.isdigit,
+        '2': ':'.__eq__,
+        '3': str.isdigit, '4': str.isdigit,
+        '5': ':'.__eq__,
+        '6': str.isdigit, '7': str.isdigit,
+    }
+
     def _key_validate(self, action, index, char, **kwargs):
-        valid = True
+        # deletion is always allowed
         if action == '0':
-            valid = True
-        elif index in ('0', '1', '3', '4', '6', '7'):
-            valid = char.isdigit()
-        elif index in ('2', '5'):
-            valid = (char == ':')
-        else:
-            valid = False
-        return valid
+            return True
+        validator = self._POS_VALIDATORS.get(index)
+        return validator is not None and validator(char)
 
     def _focusout_validate(self, event):
         valid = True
@@ -165,29 +191,45 @@ class ValidatedCombobox(ValidatedMixin, ttk.Combobox):
         ~ sees if the value is provided or not
         ~ prevents wrong keystrokes'''
 
+    # values along with their lowercase form, read from widget only after values change
+    _lowered_values = None
+
+    def configure(self, cnf=None, **kw):
+        if 'values' in kw or (cnf and 'values' in cnf):
+            self._lowered_values = None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def __setitem__(self, key, value):
+        if key == 'values':
+            self._lowered_values = None
+        super().__setitem__(key, value)
+
     def _key_validate(self, proposed, action, **kwargs):
-        valid = True
         # if the user tries to delete, just clear the field
         if action == '0':
             self.set('')
             return True
 
         # get our values list
-        values = self.cget('values')
-        # Do a case-insensitive match against the entered text
-        matching = [
-            x for x in values
-            if x.lower().startswith(proposed.lower())
-        ]
-
-        if len(matching) == 0:
-            valid = False
-        elif len(matching) == 1:
-            self.set(matching[0])
+        if self._lowered_values is None:
+            self._lowered_values = tuple((x, x.lower()) for x in self.cget('values'))
+
+        # Do a case-insensitive match against the entered text, stopping once it matches two values
+        proposed = proposed.lower()
+        match = None
+        for value, lowered in self._lowered_values:
+            if lowered.startswith(proposed):
+                if match is not None:
+                    # still ambiguous, let the user keep typing
+                    return True
+                match = value
+
+        if match is not None:
+            self.set(match)
             self.icursor(tk.END)
-            valid = False
-
-        return valid
+        return False
 
     def _focusout_validate(self, **kwargs):
         valid = True